@@ -5,7 +5,8 @@
 
 from __future__ import annotations
 import os
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Sequence, Tuple
+import numpy as np
 import pandas as pd
 import matplotlib
 
@@ -26,9 +27,18 @@ PROVINCE_NAME = {
     "PEI": "Prince Edward Island",
     "QC": "Quebec",
     "SK": "Saskatchewan",
+    "NT": "Northwest Territories",
+    "NU": "Nunavut",
+    "YT": "Yukon",
     "CANADA": "Canada",
 }
 
+# Precomputed lookup: province code or (upper-cased) full name -> full name
+JURISDICTION_CODE_MAP = {
+    **PROVINCE_NAME,
+    **{name.upper(): name for name in PROVINCE_NAME.values()},
+}
+
 # expected file name patterns (you can put the files in the same folder as this script)
 DEFAULT_FILES = [
     ("Canada", "Canada.CPI.1810000401.csv"),
@@ -47,21 +57,29 @@ DEFAULT_FILES = [
 MONTH_ORDER = ["24-Jan","24-Feb","24-Mar","24-Apr","24-May","24-Jun",
                "24-Jul","24-Aug","24-Sep","24-Oct","24-Nov","24-Dec"]
 
+# Two-digit years in labels like '24-Dec': YY < pivot -> 20YY, else 19YY
+TWO_DIGIT_YEAR_PIVOT = 50
+# Plausible range for CPI month labels (Statistics Canada CPI starts in 1914)
+MONTH_YEAR_RANGE = (1900, 2099)
+
 ITEMS_FOR_AVG_CHANGE = [
     "Food",
     "Shelter",
     "All-items excluding food and energy",
 ]
 
-def _melt_one(df: pd.DataFrame, jurisdiction: str) -> pd.DataFrame:
+def _melt_one(df: pd.DataFrame, jurisdiction: str,
+              months: Optional[List[str]] = None) -> pd.DataFrame:
     """
     Input wide dataframe like:
       Item, 24-Jan, 24-Feb, ..., 24-Dec
     Output long tidy:
       Item, Month, Jurisdiction, CPI
+    months: month columns to keep, in order (defaults to MONTH_ORDER, i.e. 2024)
     """
+    months = MONTH_ORDER if months is None else months
     # Keep only known month columns plus "Item"
-    keep_cols = ["Item"] + [m for m in MONTH_ORDER if m in df.columns]
+    keep_cols = ["Item"] + [m for m in months if m in df.columns]
     df2 = df[keep_cols].copy()
 
     long_df = df2.melt(id_vars=["Item"],
@@ -73,27 +91,31 @@ def _melt_one(df: pd.DataFrame, jurisdiction: str) -> pd.DataFrame:
     long_df["CPI"] = pd.to_numeric(long_df["CPI"], errors="coerce")
     # Order months
     long_df["Month"] = pd.Categorical(long_df["Month"],
-                                      categories=MONTH_ORDER,
+                                      categories=months,
                                       ordered=True)
     return long_df[["Item","Month","Jurisdiction","CPI"]]
 
 
-def read_cpi_file(path: str, jurisdiction: str) -> pd.DataFrame:
+def read_cpi_file(path: str, jurisdiction: str,
+                  months: Optional[List[str]] = None) -> pd.DataFrame:
     df = pd.read_csv(path)
-    return _melt_one(df, jurisdiction)
+    return _melt_one(df, jurisdiction, months)
 
 
-def combine_cpi(files: List[Tuple[str,str]], folder: str = ".") -> pd.DataFrame:
+def combine_cpi(files: List[Tuple[str,str]], folder: str = ".",
+                months: Optional[List[str]] = None) -> pd.DataFrame:
     """
     files: list of (Jurisdiction, filename)
     folder: directory where CSVs live
+    months: month columns to keep (defaults to MONTH_ORDER); pass a longer
+            list to load multi-year files for real_min_wage_panel
     """
     frames = []
     for jur, fname in files:
         full = os.path.join(folder, fname)
         if not os.path.exists(full):
             raise FileNotFoundError(f"Missing file: {full}")
-        frames.append(read_cpi_file(full, jur))
+        frames.append(read_cpi_file(full, jur, months))
     out = pd.concat(frames, ignore_index=True)
     # Sort
     out = out.sort_values(["Item","Jurisdiction","Month"]).reset_index(drop=True)
@@ -161,6 +183,7 @@ def equivalent_salary(df: pd.DataFrame,
 def load_min_wages(path: str) -> pd.DataFrame:
     """
     Expect a CSV with at least: Jurisdiction (province names) and MinimumWage (nominal).
+    An optional EffectiveDate column allows several wage vintages per province.
     If your CSV has different column names, tweak mapping below.
     """
     w = pd.read_csv(path)
@@ -169,11 +192,146 @@ def load_min_wages(path: str) -> pd.DataFrame:
     # Heuristics
     jcol = cols.get("jurisdiction") or cols.get("province") or cols.get("region") or list(w.columns)[0]
     wcol = cols.get("minimumwage") or cols.get("minwage") or cols.get("wage") or list(w.columns)[1]
+    dcol = cols.get("effectivedate") or cols.get("effective date") or cols.get("date")
     w2 = w.rename(columns={jcol: "Jurisdiction", wcol: "MinimumWage"})
-    w2["Jurisdiction"] = w2["Jurisdiction"].apply(
-        lambda val: PROVINCE_NAME.get(str(val).upper(), val)
-    )
-    return w2[["Jurisdiction","MinimumWage"]]
+    codes = w2["Jurisdiction"].astype(str).str.strip().str.upper()
+    w2["Jurisdiction"] = codes.map(JURISDICTION_CODE_MAP).fillna(w2["Jurisdiction"])
+    if dcol is None:
+        return w2[["Jurisdiction","MinimumWage"]]
+    w2 = w2.rename(columns={dcol: "EffectiveDate"})
+    w2["EffectiveDate"] = pd.to_datetime(w2["EffectiveDate"])
+    return w2[["Jurisdiction","MinimumWage","EffectiveDate"]]
+
+
+def _month_ordinals(labels: Sequence[str]) -> np.ndarray:
+    """
+    Convert month labels to integer months since 1970-01.
+    Short labels like '24-Dec' (as in the CPI files) have two-digit years, read
+    against TWO_DIGIT_YEAR_PIVOT (00-49 -> 2000s, 50-99 -> 1900s). Other labels
+    need a four-digit year, e.g. '1960-01' or 'Jan-1960'; 'Jan-24' is rejected.
+    """
+    idx = pd.Index(labels, dtype=str)
+    short = idx.str.fullmatch(r"\d{2}-[A-Za-z]{3}")
+    mon_yy = idx[idx.str.fullmatch(r"[A-Za-z]{3}-\d{2}")]
+    if len(mon_yy):
+        raise ValueError(f"Ambiguous month label(s) {list(mon_yy)}; "
+                         "use 'YY-Mon' (e.g. '24-Jan') or a four-digit year (e.g. 'Jan-2024')")
+    if short.all():
+        parts = idx.str.extract(r"(\d{2})-([A-Za-z]{3})")
+        yy = parts[0].astype(int)
+        year = np.where(yy < TWO_DIGIT_YEAR_PIVOT, 2000 + yy, 1900 + yy)
+        dates = pd.DatetimeIndex(pd.to_datetime(pd.Series(year).astype(str) + "-" + parts[1],
+                                                format="%Y-%b"))
+    elif short.any():
+        raise ValueError("Mix of two-digit ('24-Dec') and other month labels; use one format")
+    else:
+        dates = pd.DatetimeIndex(pd.to_datetime(idx, format="mixed"))
+    lo, hi = MONTH_YEAR_RANGE
+    bad = idx[(dates.year < lo) | (dates.year > hi)]
+    if len(bad):
+        raise ValueError(f"Month label(s) outside {lo}-{hi}: {list(bad)}")
+    return dates.values.astype("datetime64[M]").astype(np.int64)
+
+
+def _leaders(values: np.ndarray, names: np.ndarray, largest: bool) -> np.ndarray:
+    """
+    Jurisdiction with the largest (or smallest) value in each column of a
+    (jurisdiction x month) array, ignoring NaN. Months with no data give None.
+    """
+    if values.shape[0] == 0:
+        return np.full(values.shape[1], None, dtype=object)
+    fill = -np.inf if largest else np.inf
+    filled = np.where(np.isnan(values), fill, values)
+    idx = filled.argmax(axis=0) if largest else filled.argmin(axis=0)
+    return np.where(np.isnan(values).all(axis=0), None, names[idx])
+
+
+def real_min_wage_panel(df: pd.DataFrame,
+                        wages_df: pd.DataFrame,
+                        item: str = "All-items",
+                        base_months: Optional[Sequence[str]] = None) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Real minimum wage for every (Jurisdiction, Month) in the CPI data.
+    For each month the wage in effect is the latest vintage whose EffectiveDate
+    falls in or before that month (a mid-month date counts for its whole month).
+    Wages without a date (no column, or a blank/NaT entry) are treated as in
+    effect since before the data starts.
+    Real wages are reported in index dollars (nominal * 100 / CPI) and, for each
+    month in base_months, in that month's dollars (nominal * CPI_base / CPI).
+    Returns (long panel DataFrame, leaders DataFrame indexed by Month).
+    """
+    # CPI as a (jurisdiction x month) array
+    cpi_long = df[df["Item"] == item]
+    jurs = np.array(sorted(wages_df["Jurisdiction"].dropna().unique()), dtype=object)
+    months = pd.Index(cpi_long["Month"].astype(str).unique())
+    month_ord = _month_ordinals(months)
+    order = np.argsort(month_ord, kind="stable")
+    months, month_ord = months[order], month_ord[order]
+
+    cpi = np.full((len(jurs), len(months)), np.nan)
+    jc = pd.Categorical(cpi_long["Jurisdiction"], categories=jurs).codes
+    mc = months.get_indexer(cpi_long["Month"].astype(str))
+    known = jc >= 0
+    cpi[jc[known], mc[known]] = cpi_long["CPI"].to_numpy(dtype=float)[known]
+
+    # Effective month of each wage row, as an offset from the first CPI month,
+    # clamped to [0, n_span]: undated or earlier rows -> 0 (in effect from the
+    # start), later rows -> n_span (never reached). Keys therefore stay small.
+    first = month_ord[0] if len(month_ord) else 0
+    n_span = int(month_ord[-1] - first + 1) if len(month_ord) else 0
+    w_jc = pd.Categorical(wages_df["Jurisdiction"], categories=jurs).codes.astype(np.int64)
+    w_rel = np.zeros(len(wages_df), dtype=np.int64)
+    # Full effective date breaks ties between rows sharing a clamped month, so
+    # the latest vintage sorts last; NaT casts to int64 min and sorts first
+    w_eff = np.zeros(len(wages_df), dtype=np.int64)
+    if "EffectiveDate" in wages_df.columns:
+        eff = pd.to_datetime(wages_df["EffectiveDate"]).values.astype("datetime64[ns]")
+        w_eff = eff.astype(np.int64)
+        eff_m = eff.astype("datetime64[M]")
+        dated = ~np.isnat(eff_m)
+        w_rel[dated] = np.clip(eff_m[dated].astype(np.int64) - first, 0, n_span)
+
+    # Wage in effect per (jurisdiction, month): sort rows by (jurisdiction,
+    # effective month, effective date), then one searchsorted for every
+    # (jurisdiction, month); side="right" picks the last, i.e. latest, row
+    j_idx = np.arange(len(jurs))
+    wage = np.full((len(jurs), len(months)), np.nan)
+    if len(wages_df) and len(months):
+        w_sort = np.lexsort((w_eff, w_rel, w_jc))
+        w_jc, w_rel = w_jc[w_sort], w_rel[w_sort]
+        w_val = wages_df["MinimumWage"].to_numpy(dtype=float)[w_sort]
+        span = n_span + 1
+        q_key = j_idx[:, None] * span + (month_ord - first)[None, :]
+        pos = np.searchsorted(w_jc * span + w_rel, q_key, side="right") - 1
+        safe = np.clip(pos, 0, None)
+        valid = (pos >= 0) & (w_jc[safe] == j_idx[:, None])
+        wage = np.where(valid, w_val[safe], np.nan)
+
+    real = wage * 100.0 / cpi
+
+    panel = pd.DataFrame({
+        "Jurisdiction": np.repeat(jurs, len(months)),
+        "Month": pd.Categorical(np.tile(months, len(jurs)), categories=months, ordered=True),
+        "MinimumWage": wage.ravel(),
+        "CPI": cpi.ravel(),
+        "RealWage_IndexDollar": real.ravel(),
+    })
+    if base_months:
+        base_idx = months.get_indexer(list(base_months))
+        if (base_idx < 0).any():
+            missing = [m for m, i in zip(base_months, base_idx) if i < 0]
+            raise ValueError(f"Base month(s) not in CPI data: {missing}")
+        # (jurisdiction x month x base) in one broadcast
+        rebased = wage[:, :, None] * cpi[:, None, base_idx] / cpi[:, :, None]
+        for k, m in enumerate(base_months):
+            panel[f"RealWage_{m}"] = rebased[:, :, k].ravel()
+
+    leaders = pd.DataFrame({
+        "HighestNominal": _leaders(wage, jurs, largest=True),
+        "LowestNominal": _leaders(wage, jurs, largest=False),
+        "HighestReal": _leaders(real, jurs, largest=True),
+    }, index=pd.Index(months, name="Month"))
+    return panel, leaders
 
 
 def real_min_wage_by_province(df: pd.DataFrame,
@@ -185,17 +343,12 @@ def real_min_wage_by_province(df: pd.DataFrame,
     Real wage ~ nominal / CPI (rank consistent up to a constant base).
     Returns (joined DataFrame, highest_nominal, lowest_nominal, highest_real)
     """
-    # Dec CPI per Jurisdiction
-    dec = df[(df["Item"] == item) & (df["Month"] == month)][["Jurisdiction","CPI"]].drop_duplicates()
-    j = wages_df.merge(dec, on="Jurisdiction", how="left")
-    j["RealWage_IndexDollar"] = j["MinimumWage"] * 100.0 / j["CPI"]
-
-    # Identify winners
-    highest_nominal = j.sort_values("MinimumWage", ascending=False)["Jurisdiction"].iloc[0]
-    lowest_nominal = j.sort_values("MinimumWage", ascending=True)["Jurisdiction"].iloc[0]
-    highest_real = j.sort_values("RealWage_IndexDollar", ascending=False)["Jurisdiction"].iloc[0]
+    panel, leaders = real_min_wage_panel(df, wages_df, item=item)
+    if month not in leaders.index:
+        raise ValueError(f"Month not in CPI data for {item}: {month}")
+    j = panel[panel["Month"] == month].drop(columns="Month").reset_index(drop=True)
+    highest_nominal, lowest_nominal, highest_real = leaders.loc[month]
 
-    j = j.sort_values("Jurisdiction").reset_index(drop=True)
     j["MinimumWage"] = j["MinimumWage"].round(2)
     j["RealWage_IndexDollar"] = j["RealWage_IndexDollar"].round(2)
 
@@ -0,0 +1,158 @@
+# check_min_wage_panel.py
+# Small runnable checks for real_min_wage_panel / real_min_wage_by_province.
+# Run from this folder:  python check_min_wage_panel.py
+
+import math
+import pandas as pd
+from CPI import real_min_wage_panel, real_min_wage_by_province
+
+MONTHS = ["24-Sep", "24-Oct", "24-Nov", "24-Dec"]
+
+
+def make_cpi(values: dict, months=MONTHS) -> pd.DataFrame:
+    """values: {Jurisdiction: [CPI per month]} -> long All-items CPI frame."""
+    rows = [(jur, m, cpi) for jur, cpis in values.items() for m, cpi in zip(months, cpis)]
+    df = pd.DataFrame(rows, columns=["Jurisdiction", "Month", "CPI"])
+    df["Item"] = "All-items"
+    return df
+
+
+def make_wages() -> pd.DataFrame:
+    # Ontario: two vintages, the second effective mid-October.
+    # Alberta: undated (NaT) row, in effect throughout.
+    return pd.DataFrame({
+        "Jurisdiction": ["Ontario", "Ontario", "Alberta"],
+        "MinimumWage": [16.55, 17.20, 15.00],
+        "EffectiveDate": pd.to_datetime(["2023-10-01", "2024-10-15", None]),
+    })
+
+
+def wage_at(panel: pd.DataFrame, jur: str, month: str, col: str = "MinimumWage") -> float:
+    row = panel[(panel["Jurisdiction"] == jur) & (panel["Month"] == month)]
+    return float(row[col].iloc[0])
+
+
+def check_vintages_and_undated():
+    cpi = make_cpi({"Ontario": [160, 161, 162, 163], "Alberta": [150, 151, 152, 160]})
+    panel, leaders = real_min_wage_panel(cpi, make_wages())
+
+    # Switch month: Sep uses the 2023 vintage, Oct (mid-month date) the new one
+    assert wage_at(panel, "Ontario", "24-Sep") == 16.55
+    assert wage_at(panel, "Ontario", "24-Oct") == 17.20
+    assert wage_at(panel, "Ontario", "24-Dec") == 17.20
+    # NaT row is in effect for every month and does not blank out Ontario
+    assert all(wage_at(panel, "Alberta", m) == 15.00 for m in MONTHS)
+    assert not panel["MinimumWage"].isna().any()
+
+    assert (leaders["HighestNominal"] == "Ontario").all()
+    assert (leaders["LowestNominal"] == "Alberta").all()
+    # Sep: 16.55/160 > 15/150; Dec: 17.20/163 > 15/160
+    assert leaders.loc["24-Sep", "HighestReal"] == "Ontario"
+    assert leaders.loc["24-Dec", "HighestReal"] == "Ontario"
+
+
+def check_base_months():
+    cpi = make_cpi({"Ontario": [160, 161, 162, 164], "Alberta": [150, 151, 152, 160]})
+    panel, _ = real_min_wage_panel(cpi, make_wages(), base_months=["24-Sep", "24-Dec"])
+    # Dec-24 dollars in Dec equal the nominal wage
+    assert math.isclose(wage_at(panel, "Ontario", "24-Dec", "RealWage_24-Dec"), 17.20)
+    # Dec wage in Sep-24 dollars: 17.20 * 160 / 164
+    assert math.isclose(wage_at(panel, "Ontario", "24-Dec", "RealWage_24-Sep"), 17.20 * 160 / 164)
+    assert math.isclose(wage_at(panel, "Alberta", "24-Sep", "RealWage_24-Dec"), 15.00 * 160 / 150)
+    try:
+        real_min_wage_panel(cpi, make_wages(), base_months=["23-Dec"])
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("unknown base month should raise ValueError")
+
+
+def check_nan_aware_leaders():
+    nan = float("nan")
+    cpi = make_cpi({"Ontario": [nan, 161, 162, 163], "Alberta": [150, 151, 152, 153]})
+    _, leaders = real_min_wage_panel(cpi, make_wages())
+    # Ontario has no CPI in Sep, so the real leader falls back to Alberta
+    assert leaders.loc["24-Sep", "HighestReal"] == "Alberta"
+    assert leaders.loc["24-Oct", "HighestReal"] == "Ontario"
+
+
+def check_undated_column_and_long_history():
+    months = ["1960-01", "1999-12", "2024-12"]
+    cpi = make_cpi({"Ontario": [20, 80, 160]}, months=months)
+    wages = pd.DataFrame({"Jurisdiction": ["Ontario"], "MinimumWage": [17.20]})
+    panel, _ = real_min_wage_panel(cpi, wages)
+    assert list(panel["Month"]) == months
+    assert (panel["MinimumWage"] == 17.20).all()
+
+    # Two-digit years use a fixed pivot: '60-Jan' is 1960, '24-Jan' is 2024
+    short = ["24-Jan", "60-Jan", "99-Dec"]
+    panel, _ = real_min_wage_panel(make_cpi({"Ontario": [160, 20, 80]}, months=short), wages)
+    assert list(panel["Month"]) == ["60-Jan", "99-Dec", "24-Jan"]
+
+    # 'Mon-YY' labels and implausible years are rejected, not read as 24 AD
+    for bad in (["Jan-24"], ["Jan-0024"]):
+        try:
+            real_min_wage_panel(make_cpi({"Ontario": [20]}, months=bad), wages)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"month label {bad} should raise ValueError")
+
+
+def check_unsorted_vintages():
+    cpi = make_cpi({"Ontario": [160, 161, 162, 163]})
+    # Newest first, all before the CPI data: the 2023 wage is in effect
+    wages = pd.DataFrame({
+        "Jurisdiction": ["Ontario"] * 3,
+        "MinimumWage": [16.55, 15.50, 14.00],
+        "EffectiveDate": pd.to_datetime(["2023-10-01", "2022-10-01", "2020-10-01"]),
+    })
+    panel, _ = real_min_wage_panel(cpi, wages)
+    assert (panel["MinimumWage"] == 16.55).all()
+
+    # Two vintages in the same month, later date listed first
+    wages = pd.DataFrame({
+        "Jurisdiction": ["Ontario"] * 3,
+        "MinimumWage": [17.20, 16.55, 15.50],
+        "EffectiveDate": pd.to_datetime(["2024-10-15", "2024-10-01", "2022-10-01"]),
+    })
+    panel, _ = real_min_wage_panel(cpi, wages)
+    assert wage_at(panel, "Ontario", "24-Sep") == 15.50
+    assert wage_at(panel, "Ontario", "24-Oct") == 17.20
+    assert wage_at(panel, "Ontario", "24-Nov") == 17.20
+
+
+def check_edge_cases():
+    cpi = make_cpi({"Ontario": [160, 161, 162, 163]})
+    empty = make_wages().iloc[0:0]
+    panel, leaders = real_min_wage_panel(cpi, empty)
+    assert panel.empty
+    assert list(leaders.index) == MONTHS and leaders.isna().all().all()
+
+    # Rows with a missing jurisdiction are ignored
+    wages = make_wages()
+    wages.loc[len(wages)] = [None, 99.0, pd.NaT]
+    panel, _ = real_min_wage_panel(cpi, wages)
+    assert set(panel["Jurisdiction"]) == {"Ontario", "Alberta"}
+    assert wage_at(panel, "Ontario", "24-Dec") == 17.20
+
+    try:
+        real_min_wage_by_province(cpi, make_wages(), month="23-Dec")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("month missing from CPI should raise ValueError")
+
+
+def main():
+    check_vintages_and_undated()
+    check_base_months()
+    check_nan_aware_leaders()
+    check_undated_column_and_long_history()
+    check_unsorted_vintages()
+    check_edge_cases()
+    print("real_min_wage_panel checks passed")
+
+
+if __name__ == "__main__":
+    main()